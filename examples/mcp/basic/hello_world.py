@@ -20,6 +20,7 @@ from dotenv import load_dotenv
 
 if TYPE_CHECKING:
     from mcp_agent.config import MCPSettings
+    from mcp_agent.mcp.mcp_aggregator import MCPAggregator
 
 # Add the src directory to the path for imports to work
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -62,6 +63,8 @@ def get_current_weather(location: str) -> str:
 
 # Create a simple context class that can be extended with MCP server registry
 class AgentContext:
+    __slots__ = ("mcp_config", "mcp_config_path", "mcp_server_registry", "mcp_aggregators")
+
     def __init__(self, mcp_config: "MCPSettings" = None, mcp_config_path: str = None):
         """
         Initialize the context.
@@ -76,6 +79,18 @@ class AgentContext:
         """
         self.mcp_config_path = mcp_config_path
         self.mcp_config = mcp_config
+        # Populated with the MCP server registry when the agent is first run
+        self.mcp_server_registry = None
+        # MCP aggregators keyed by their server registry id and set of server names, which keep
+        # the MCP server connections alive across runs instead of restarting them on every run
+        self.mcp_aggregators: dict[tuple[int, frozenset[str]], MCPAggregator] = {}
+
+    async def close(self):
+        """Close the pooled MCP aggregators, shutting down their server connections."""
+        # Close in reverse order of creation, as the connections are nested task groups
+        for aggregator in reversed(self.mcp_aggregators.values()):
+            await aggregator.__aexit__(None, None, None)
+        self.mcp_aggregators.clear()
 
 
 async def main():
@@ -112,26 +127,30 @@ async def main():
     # Set the MCP servers to use
     agent.mcp_servers = ["fetch", "filesystem"]  # Specify which MCP servers to use
 
-    # Run the agent - tools from the specified MCP servers will be automatically loaded
-    result = await Runner.run(
-        starting_agent=agent,
-        input="What's the weather like in Miami?",
-        context=context,
-    )
-
-    # Print the agent's response
-    print("\nAgent response:")
-    print(result.final_output)
-
-    result = await Runner.run(
-        starting_agent=agent,
-        input="Print the first paragraph of https://openai.github.io/openai-agents-python/",
-        context=context,
-    )
-
-    # Print the agent's response
-    print("\nAgent response:")
-    print(result.final_output)
+    try:
+        # Run the agent - tools from the specified MCP servers will be automatically loaded
+        result = await Runner.run(
+            starting_agent=agent,
+            input="What's the weather like in Miami?",
+            context=context,
+        )
+
+        # Print the agent's response
+        print("\nAgent response:")
+        print(result.final_output)
+
+        # The MCP server connections from the first run are reused
+        result = await Runner.run(
+            starting_agent=agent,
+            input="Print the first paragraph of https://openai.github.io/openai-agents-python/",
+            context=context,
+        )
+
+        # Print the agent's response
+        print("\nAgent response:")
+        print(result.final_output)
+    finally:
+        await context.close()
 
 
 if __name__ == "__main__":
@@ -51,6 +51,8 @@ def get_current_weather(location: str) -> str:
 
 # Create a simple context class that can be extended with MCP server registry
 class AgentContext:
+    __slots__ = ("mcp_config", "mcp_config_path", "mcp_server_registry")
+
     def __init__(self, mcp_config: "MCPSettings" = None, mcp_config_path: str = None):
         """
         Initialize the context.
@@ -65,6 +67,8 @@ class AgentContext:
         """
         self.mcp_config_path = mcp_config_path
         self.mcp_config = mcp_config
+        # Populated with the MCP server registry when the agent is first run
+        self.mcp_server_registry = None
 
 
 async def main():
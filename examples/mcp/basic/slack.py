@@ -34,6 +34,8 @@ from agents import Agent, Runner
 class AgentContext:
     """Context class for the agent that can hold MCP settings."""
 
+    __slots__ = ("mcp_config", "mcp_config_path", "mcp_server_registry")
+
     def __init__(self, mcp_config_path: str = None, mcp_config: "MCPSettings" = None):
         """
         Initialize the context.
@@ -44,6 +46,8 @@ class AgentContext:
         """
         self.mcp_config_path = mcp_config_path
         self.mcp_config = mcp_config
+        # Populated with the MCP server registry when the agent is first run
+        self.mcp_server_registry = None
 
 
 async def main():
@@ -114,6 +114,13 @@ class Agent(Generic[TContext]):
     _mcp_aggregator: MCPAggregator | None = None
     """The MCP aggregator used by this agent. Will be created lazily when needed."""
 
+    _mcp_aggregator_pooled: bool = False
+    """Whether the MCP aggregator is pooled in the run context, which is then responsible for
+    closing it."""
+
+    _mcp_tools: list[Tool] = field(default_factory=list)
+    """The tools loaded from MCP servers, which were added to this agent's tools."""
+
     _mcp_initialized: bool = False
     """Whether MCP tools have been loaded for this agent."""
 
@@ -180,15 +187,24 @@ class Agent(Generic[TContext]):
 
         return None
 
-    async def load_mcp_tools(self, run_context: RunContextWrapper[TContext]) -> None:
-        """Load tools from MCP servers and add them to this agent's tools."""
+    async def load_mcp_tools(
+        self, run_context: RunContextWrapper[TContext], use_pool: bool = True
+    ) -> None:
+        """
+        Load tools from MCP servers and add them to this agent's tools.
+
+        Args:
+            run_context: Run context wrapper
+            use_pool: Whether to reuse (and add to) the MCP aggregator pool of the context, if it
+                has one. Should be False if this isn't called from the task which closes the pool.
+        """
 
         logger.debug(f"MCP servers: {self.mcp_servers}")
 
         if not self.mcp_servers or self._mcp_initialized:
             return
 
-        from .mcp import initialize_mcp_aggregator, mcp_list_tools
+        from .mcp import get_mcp_aggregator_pool, initialize_mcp_aggregator, mcp_list_tools
 
         if self._mcp_aggregator is None:
             self._mcp_aggregator = await initialize_mcp_aggregator(
@@ -196,7 +212,11 @@ class Agent(Generic[TContext]):
                 name=self.name,
                 servers=self.mcp_servers,
                 server_registry=self.mcp_server_registry,
-                connection_persistence=True
+                connection_persistence=True,
+                use_pool=use_pool
+            )
+            self._mcp_aggregator_pooled = (
+                use_pool and get_mcp_aggregator_pool(run_context) is not None
             )
 
         # Get all tools from the MCP servers
@@ -205,14 +225,23 @@ class Agent(Generic[TContext]):
         # Add the MCP tools to the agent's tools
         logger.info(f"Adding {len(mcp_tools)} MCP tools to agent {self.name}")
         self.tools.extend(mcp_tools)
+        self._mcp_tools = mcp_tools
         self._mcp_initialized = True
 
     async def cleanup_resources(self) -> None:
         """Clean up resources when the agent is done."""
         if self._mcp_aggregator:
             logger.info(f"Cleaning up MCP resources for agent {self.name}")
+
+            # Remove the MCP tools, which are added again when the MCP tools are next loaded
+            mcp_tool_ids = {id(tool) for tool in self._mcp_tools}
+            self.tools[:] = [tool for tool in self.tools if id(tool) not in mcp_tool_ids]
+            self._mcp_tools = []
+
             try:
-                await self._mcp_aggregator.__aexit__(None, None, None)
+                # Pooled aggregators are kept alive for later runs, and closed by the context
+                if not self._mcp_aggregator_pooled:
+                    await self._mcp_aggregator.__aexit__(None, None, None)
                 self._mcp_aggregator = None
                 self._mcp_initialized = False
             except Exception as e:
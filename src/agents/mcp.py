@@ -1,11 +1,36 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Set
-
-from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool as MCPTool
-from mcp_agent.config import MCPSettings, Settings, get_settings
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, List, Set
+
+import yaml
+from mcp.client.session import ClientSession
+from mcp.shared.session import ReceiveNotificationT
+from mcp.types import (
+    CallToolResult,
+    EmbeddedResource,
+    ImageContent,
+    ListToolsResult,
+    ServerNotification,
+    TextContent,
+    TextResourceContents,
+    Tool as MCPTool,
+    ToolListChangedNotification,
+)
+from mcp_agent.config import MCPSettings, Settings
 from mcp_agent.context import Context
-from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+from mcp_agent.mcp.gen_client import gen_client
+from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
+from mcp_agent.mcp.mcp_aggregator import SEP, MCPAggregator, NamespacedTool
+from mcp_agent.mcp.mcp_connection_manager import MCPConnectionManager
 from mcp_agent.mcp_server_registry import ServerRegistry
 
 from . import _utils
@@ -13,22 +38,200 @@ from .logger import logger
 from .run_context import RunContextWrapper, TContext
 from .tool import FunctionTool, Tool
 
+try:
+    # Use the libyaml C bindings when available, which parse considerably faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 MCPContent = TextContent | ImageContent | EmbeddedResource
 
+# Bound at module scope, as it is called on every MCP tool invocation.
+# orjson is used when installed, as it parses JSON considerably faster.
+try:
+    import orjson
+
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Directory for the cached tool listings of MCP servers, keyed by a hash of the server config
+_SERVER_DESCRIPTIONS_DIR = Path(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+) / "openai-agents-mcp" / "server_descriptions"
+
+# Server registries keyed by (absolute config path, config mtime, secrets mtime)
+# or (config hash, 0.0, 0.0)
+_REGISTRY_CACHE: dict[tuple[str, float, float], ServerRegistry] = {}
+
+def _registry_cache_key(
+    config: MCPSettings | None,
+    config_path: str | None
+) -> tuple[str, float, float] | None:
+    """
+    Compute the registry cache key for the given config object or config file path.
+    The key for a config file includes the mtime of the mcp_agent.secrets.yaml next to it,
+    since it is merged into the settings the registry is built from.
+    Returns None if the registry can't be cached (e.g. the config file doesn't exist).
+    """
+    if config:
+        digest = hashlib.blake2b(config.model_dump_json().encode(), digest_size=16).hexdigest()
+        return (f"config:{digest}", 0.0, 0.0)
+
+    if config_path:
+        path = os.path.abspath(config_path)
+        try:
+            config_mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        try:
+            secrets_mtime = os.stat(
+                os.path.join(os.path.dirname(path), "mcp_agent.secrets.yaml")
+            ).st_mtime
+        except OSError:
+            secrets_mtime = 0.0
+        return (path, config_mtime, secrets_mtime)
+
+    return None
+
+def clear_mcp_server_registry_cache() -> None:
+    """Clear all cached MCP server registries, forcing the next load to re-read the config."""
+    _REGISTRY_CACHE.clear()
+
+def _load_yaml_file(path: Path) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+def _deep_merge(base: dict[str, Any], update: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merge two dictionaries, preserving nested structures."""
+    merged = base.copy()
+    for key, value in update.items():
+        if isinstance(merged.get(key), dict) and isinstance(value, dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+def _settings_cache_path(config_file: Path) -> Path:
+    """Path of the JSON sidecar cache for a config file, e.g. .mcp_agent.config.cache.json"""
+    return config_file.parent / f".{config_file.stem}.cache.json"
+
+def _source_digests(*paths: Path) -> dict[str, str]:
+    """
+    Hash the contents of the given files. Hashing is much cheaper than parsing the YAML, and unlike
+    the mtime, it can't match for a changed file (e.g. one copied with `cp -p` or `rsync -t`).
+    """
+    return {
+        str(path): hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        for path in paths
+        if path.exists()
+    }
+
+def _read_settings_cache(cache_file: Path, sources: dict[str, str]) -> dict[str, Any] | None:
+    """Read the parsed config from the sidecar cache, if it is fresh for the given sources."""
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("sources") != sources:
+        return None
+    return cached.get("settings")
+
+def _atomic_write_json(path: Path, data: Any) -> None:
+    """
+    Write data as JSON to a temporary file which is atomically renamed into place, so concurrent
+    processes never observe a partially written file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def _write_settings_cache(
+    cache_file: Path,
+    sources: dict[str, str],
+    settings: dict[str, Any]
+) -> None:
+    """Write the parsed config to the sidecar cache."""
+    try:
+        _atomic_write_json(cache_file, {"sources": sources, "settings": settings})
+    except (OSError, TypeError, ValueError) as e:
+        # The cache is only an optimization (e.g. the config directory may be read-only)
+        logger.debug("Unable to write MCP settings cache %s: %s", cache_file, e)
+
+def _load_settings(config_path: str | None = None) -> Settings:
+    """
+    Load mcp-agent settings from the config file (and the mcp_agent.secrets.yaml next to it).
+    Mirrors `mcp_agent.config.get_settings`, but parses YAML with the libyaml C loader when
+    available, and doesn't pin the result in a process-wide singleton.
+
+    The parsed config YAML is also persisted to a JSON sidecar next to the config file, which is
+    used instead of re-parsing the YAML as long as the config file's contents are unchanged. The
+    secrets are never written to the sidecar (it lives in the project directory and may get
+    committed), so the secrets file is parsed and merged in on every load.
+
+    Args:
+        config_path: Path to the config file. If unspecified, the config file is discovered
+            recursively up from the current working directory.
+    """
+    config_file = Path(config_path) if config_path else Settings.find_config()
+    if not config_file or not config_file.exists():
+        return Settings()
+
+    secrets_file = config_file.parent / "mcp_agent.secrets.yaml"
+    cache_file = _settings_cache_path(config_file)
+    sources = _source_digests(config_file)
+
+    config_settings = _read_settings_cache(cache_file, sources)
+    if config_settings is not None:
+        logger.debug("Loaded MCP config from cache file: %s", cache_file)
+    else:
+        config_settings = _load_yaml_file(config_file)
+        _write_settings_cache(cache_file, sources, config_settings)
+
+    merged_settings = config_settings
+    if secrets_file.exists():
+        merged_settings = _deep_merge(config_settings, _load_yaml_file(secrets_file))
+
+    return Settings(**merged_settings)
+
+class _SharedContextServerRegistry(ServerRegistry):
+    """Server registry which holds the mcp-agent context shared by all aggregators using it."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.shared_context: Context | None = None
+
 # Define a method to automatically load MCP server registry if using MCP servers
 def load_mcp_server_registry(
     config: MCPSettings | None = None,
-    config_path: str | None = None
+    config_path: str | None = None,
+    use_cache: bool = True
 ) -> ServerRegistry:
     """
     Load MCP server registry from config object or config file path.
 
+    Registries are cached by the absolute config file path and its mtime (or by a hash of the
+    config object), so repeated loads of an unchanged config reuse the same registry.
+
     Args:
         config: The MCPSettings object containing the server configurations.
             If unspecified, it will be loaded from the config_path.
         config_path: The file path to load the MCP server configurations from.
             if config is unspecified, this is required.
+        use_cache: Whether to reuse a previously loaded registry for the same config
     """
+    cache_key = _registry_cache_key(config, config_path)
+    if use_cache and cache_key and cache_key in _REGISTRY_CACHE:
+        logger.debug("Using cached MCP server registry for %s", cache_key[0])
+        return _REGISTRY_CACHE[cache_key]
+
     try:
         settings: Settings = None
         if config:
@@ -38,18 +241,27 @@ def load_mcp_server_registry(
         else:
             # Load settings from config file
             logger.debug("Loading MCP server registry from config file: %s", config_path)
-            settings = get_settings(config_path)
+            settings = _load_settings(config_path)
 
         # Create the ServerRegistry instance
-        server_registry = ServerRegistry(config=settings)
+        server_registry = _SharedContextServerRegistry(config=settings)
+
+        if cache_key:
+            # Invalidate entries for the same config file with stale mtimes
+            for key in [key for key in _REGISTRY_CACHE if key[0] == cache_key[0]]:
+                del _REGISTRY_CACHE[key]
+            _REGISTRY_CACHE[cache_key] = server_registry
+
         return server_registry
     except Exception as e:
-        logger.error(
-            "Error loading MCP server registry. config=%s, config_path=%s, Error: %s",
-            config.model_dump_json() if config else "None",
-            config_path,
-            e
-        )
+        # Only dump the config if the error will actually be logged
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Error loading MCP server registry. config=%s, config_path=%s, Error: %s",
+                config.model_dump_json() if config else "None",
+                config_path,
+                e
+            )
         raise
 
 def ensure_mcp_server_registry_in_context(
@@ -58,25 +270,337 @@ def ensure_mcp_server_registry_in_context(
 ) -> ServerRegistry:
     """
     Load the MCP server registry and attach it to the context object.
-    If the server registry is already loaded, it will b
+    If the server registry is already loaded, it will be reused unless `force` is set.
 
     Args:
         run_context: Run context wrapper which will have the server registry attached
         force: Whether to force reload the server registry
     """
+    ctx = run_context.context
+
     # Check if server registry is already loaded
-    server_registry = getattr(run_context.context, 'server_registry', None)
+    server_registry = getattr(ctx, 'mcp_server_registry', None)
     if not force and server_registry:
         logger.debug("MCP server registry already loaded in context. Skipping reload.")
         return server_registry
 
     # Load the server registry
-    config = getattr(run_context.context, 'mcp_config', None)
-    config_path = getattr(run_context.context, 'mcp_config_path', None)
-    server_registry = load_mcp_server_registry(config=config, config_path=config_path)
+    server_registry = load_mcp_server_registry(
+        config=getattr(ctx, 'mcp_config', None),
+        config_path=getattr(ctx, 'mcp_config_path', None),
+        use_cache=not force
+    )
 
     # Attach the server registry to the context
-    run_context.context.mcp_server_registry = server_registry
+    ctx.mcp_server_registry = server_registry
+    return server_registry
+
+class _ToolListChangedClientSession(MCPAgentClientSession):
+    """Client session which reports `notifications/tools/list_changed` from the server."""
+
+    def __init__(self, *args: Any, on_tool_list_changed: Callable[[], None], **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._on_tool_list_changed = on_tool_list_changed
+
+    async def __aenter__(self):
+        session = await super().__aenter__()
+        # The receive loop hands every notification to `incoming_messages` through an unbuffered
+        # stream, and blocks until it is read. Nothing else reads it, so without draining it the
+        # session would stop receiving responses after the server's first notification.
+        self._task_group.start_soon(self._drain_incoming_messages)
+        return session
+
+    async def _drain_incoming_messages(self) -> None:
+        async for _ in self.incoming_messages:
+            pass
+
+    async def _received_notification(self, notification: ReceiveNotificationT) -> None:
+        if isinstance(notification, ServerNotification) and isinstance(
+            notification.root, ToolListChangedNotification
+        ):
+            self._on_tool_list_changed()
+        await super()._received_notification(notification)
+
+class LazyMCPAggregator(MCPAggregator):
+    """
+    MCP aggregator that only connects to an MCP server when it is first needed.
+
+    Entering the aggregator doesn't start any servers. Tool listings are served from a disk cache of
+    server descriptions (keyed by a hash of each server's config), and a server is only connected
+    to on the first call to one of its tools, or when listing tools of a server that has no
+    cached description yet. Servers whose tools are never called are never started.
+
+    The aggregated tool listing is also kept in memory, until a server's tools are (re)loaded or
+    a persistently connected server notifies that its list of tools changed.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Servers which are connected and whose tools are loaded into the tool maps
+        self._loaded_servers: set[str] = set()
+        # Tools of servers that aren't loaded yet, read from the server descriptions cache
+        self._cached_server_tools: dict[str, list[MCPTool]] = {}
+        self._server_locks: dict[str, asyncio.Lock] = {}
+        # The aggregated tool listing, until the tools of any server change
+        self._tools_cache: ListToolsResult | None = None
+        # Function tools converted from the MCP tools, keyed by namespaced tool name. They are
+        # kept for as long as the aggregator, so pooled aggregators reuse them across runs.
+        self._function_tools: dict[str, tuple[MCPTool, FunctionTool]] = {}
+
+    async def __aenter__(self):
+        if self.initialized:
+            return self
+
+        # Keep a connection manager for persistent connections, but don't start any servers yet
+        if self.connection_persistence:
+            self._persistent_connection_manager = MCPConnectionManager(
+                self._get_server_registry()
+            )
+            await self._persistent_connection_manager.__aenter__()
+
+        self.initialized = True
+        return self
+
+    async def close(self):
+        try:
+            await super().close()
+        finally:
+            self.initialized = False
+            self._tools_cache = None
+            self._function_tools.clear()
+            self._loaded_servers.clear()
+            self._namespaced_tool_map.clear()
+            self._server_to_tool_map.clear()
+
+    async def load_servers(self):
+        """Connect to all servers and load their tools, initializing the servers concurrently."""
+        results = await asyncio.gather(
+            *(self._ensure_server(server_name) for server_name in self.server_names),
+            return_exceptions=True,
+        )
+        for server_name, result in zip(self.server_names, results):
+            if isinstance(result, BaseException):
+                logger.error("Error loading MCP server %s: %s", server_name, result)
+        self.initialized = True
+
+    async def list_tools(self) -> ListToolsResult:
+        """
+        :return: Tools from all servers aggregated, and renamed to be dot-namespaced by server name.
+        """
+        if self._tools_cache is not None:
+            return self._tools_cache
+
+        # Servers without a cached description are connected to concurrently
+        results = await asyncio.gather(
+            *(self._get_server_tools(server_name) for server_name in self.server_names),
+            return_exceptions=True,
+        )
+
+        tools: list[MCPTool] = []
+        complete = True
+        for server_name, server_tools in zip(self.server_names, results):
+            if isinstance(server_tools, BaseException):
+                logger.error(
+                    "Error loading tools from MCP server %s: %s", server_name, server_tools
+                )
+                complete = False
+                continue
+            for tool in server_tools:
+                tools.append(tool.model_copy(update={"name": f"{server_name}{SEP}{tool.name}"}))
+
+        tools_result = ListToolsResult(tools=tools)
+        # Don't keep a listing missing the tools of a failed server, so it is retried next time
+        if complete:
+            self._tools_cache = tools_result
+        return tools_result
+
+    def invalidate_tools(self, server_name: str | None = None) -> None:
+        """
+        Invalidate the tool listing, so the tools are listed from the servers again.
+
+        Args:
+            server_name: The server whose tools changed. If unspecified, the tools of all servers
+                are reloaded.
+        """
+        self._tools_cache = None
+        for name in [server_name] if server_name else self.server_names:
+            self._loaded_servers.discard(name)
+            self._cached_server_tools.pop(name, None)
+            for tool_name in [n for n in self._function_tools if n.startswith(f"{name}{SEP}")]:
+                del self._function_tools[tool_name]
+
+            # The server's cached description is stale as well
+            path = self._server_description_path(name)
+            if path is not None:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any] | None = None
+    ) -> CallToolResult:
+        """
+        Call a namespaced tool, e.g., 'server_name.tool_name', connecting to its server if needed.
+        """
+        resolved = self._resolve_tool(name)
+        if resolved is None:
+            logger.error("MCP tool '%s' not found", name)
+            return CallToolResult(
+                isError=True,
+                content=[TextContent(type="text", text=f"Tool '{name}' not found")],
+            )
+
+        server_name, local_tool_name = resolved
+        await self._ensure_server(server_name)
+        return await super().call_tool(
+            name=f"{server_name}{SEP}{local_tool_name}",
+            arguments=arguments
+        )
+
+    def get_function_tool(self, mcp_tool: MCPTool) -> FunctionTool:
+        """
+        Get the function tool for a namespaced MCP tool from the tool listing, converting it only
+        if it wasn't converted before (or the tool changed since).
+        """
+        cached = self._function_tools.get(mcp_tool.name)
+        if cached is not None and (cached[0] is mcp_tool or cached[0] == mcp_tool):
+            return cached[1]
+
+        tool = mcp_tool_to_function_tool(mcp_tool, self)
+        self._function_tools[mcp_tool.name] = (mcp_tool, tool)
+        return tool
+
+    def _resolve_tool(self, name: str) -> tuple[str, str] | None:
+        """Resolve a (possibly namespaced) tool name to its server name and local tool name."""
+        if SEP in name:
+            server_name, local_tool_name = name.split(SEP, 1)
+            if server_name in self.server_names:
+                return server_name, local_tool_name
+
+        # Un-namespaced tool name, so find the first server which provides it
+        for server_name in self.server_names:
+            if server_name in self._loaded_servers:
+                server_tools = [t.tool for t in self._server_to_tool_map.get(server_name, [])]
+            else:
+                server_tools = self._cached_server_tools.get(server_name, [])
+            if any(tool.name == name for tool in server_tools):
+                return server_name, name
+
+        return None
+
+    async def _get_server_tools(self, server_name: str) -> list[MCPTool]:
+        """Get the tools of a server, without connecting to it if its description is cached."""
+        if server_name not in self._loaded_servers:
+            if server_name not in self._cached_server_tools:
+                cached_tools = self._read_server_description(server_name)
+                if cached_tools is not None:
+                    self._cached_server_tools[server_name] = cached_tools
+
+            if server_name in self._cached_server_tools:
+                return self._cached_server_tools[server_name]
+
+            await self._ensure_server(server_name)
+
+        return [t.tool for t in self._server_to_tool_map.get(server_name, [])]
+
+    async def _ensure_server(self, server_name: str) -> None:
+        """Connect to the server (if not connected yet) and load its tools into the tool maps."""
+        if server_name in self._loaded_servers:
+            return
+
+        lock = self._server_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            if server_name in self._loaded_servers:
+                return
+
+            logger.debug("Lazily loading MCP server %s for %s", server_name, self.agent_name)
+            tools = await self._fetch_server_tools(server_name)
+
+            async with self._tool_map_lock:
+                # Drop the tools previously loaded from this server, which may have changed
+                for namespaced_tool in self._server_to_tool_map.get(server_name, []):
+                    self._namespaced_tool_map.pop(namespaced_tool.namespaced_tool_name, None)
+
+                self._server_to_tool_map[server_name] = []
+                for tool in tools:
+                    namespaced_tool_name = f"{server_name}{SEP}{tool.name}"
+                    namespaced_tool = NamespacedTool(
+                        tool=tool,
+                        server_name=server_name,
+                        namespaced_tool_name=namespaced_tool_name,
+                    )
+                    self._namespaced_tool_map[namespaced_tool_name] = namespaced_tool
+                    self._server_to_tool_map[server_name].append(namespaced_tool)
+
+            self._loaded_servers.add(server_name)
+            self._cached_server_tools.pop(server_name, None)
+            self._tools_cache = None
+            self._write_server_description(server_name, tools)
+
+    async def _fetch_server_tools(self, server_name: str) -> list[MCPTool]:
+        """Connect to the server and list its tools."""
+
+        async def fetch_tools(client: ClientSession) -> list[MCPTool]:
+            result = await client.list_tools()
+            return result.tools or []
+
+        if self.connection_persistence:
+            server_connection = await self._persistent_connection_manager.get_server(
+                server_name,
+                client_session_factory=functools.partial(
+                    _ToolListChangedClientSession,
+                    on_tool_list_changed=functools.partial(self.invalidate_tools, server_name),
+                ),
+            )
+            session = server_connection.session
+            if session is None:
+                raise RuntimeError(f"MCP server {server_name} has no client session")
+            return await fetch_tools(session)
+
+        async with gen_client(server_name, server_registry=self._get_server_registry()) as client:
+            return await fetch_tools(client)
+
+    def _get_server_registry(self) -> ServerRegistry:
+        server_registry = self.context.server_registry
+        if server_registry is None:
+            raise RuntimeError("No server registry found in the MCP aggregator's context.")
+        return server_registry
+
+    def _server_description_path(self, server_name: str) -> Path | None:
+        server_config = self._get_server_registry().get_server_config(server_name)
+        if server_config is None:
+            return None
+
+        digest = hashlib.blake2b(
+            server_config.model_dump_json().encode(), digest_size=16
+        ).hexdigest()
+        return _SERVER_DESCRIPTIONS_DIR / f"{digest}.json"
+
+    def _read_server_description(self, server_name: str) -> list[MCPTool] | None:
+        """Read the cached tools of a server, if its description has been cached before."""
+        path = self._server_description_path(server_name)
+        if path is None:
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return [MCPTool.model_validate(tool) for tool in json.load(f)]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable MCP server description %s: %s", path, e)
+            return None
+
+    def _write_server_description(self, server_name: str, tools: list[MCPTool]) -> None:
+        """Persist the tools of a server, so later processes can list them without connecting."""
+        path = self._server_description_path(server_name)
+        if path is None:
+            return
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write_json(path, [tool.model_dump(mode="json") for tool in tools])
+        except OSError as e:
+            logger.debug("Unable to write MCP server description %s: %s", path, e)
 
 def create_mcp_aggregator(
     run_context: RunContextWrapper[TContext],
@@ -100,19 +624,25 @@ def create_mcp_aggregator(
         raise RuntimeError("No MCP servers specified. No MCP aggregator created.")
 
     # Get or create the server registry from the context
-    context: Context = None
-    if server_registry:
-        context = Context(server_registry=server_registry)
-    else:
+    if not server_registry:
         server_registry = getattr(run_context.context, 'mcp_server_registry', None)
         if not server_registry:
             raise RuntimeError(
                 "No server registry found in run context. Either specify it or set in context."
             )
+
+    # Share one mcp-agent context between all aggregators using a registry loaded by
+    # `load_mcp_server_registry`. It is held by the registry, so it lives as long as the registry.
+    # Registries created elsewhere have nowhere to keep it, so they get a context per aggregator.
+    if isinstance(server_registry, _SharedContextServerRegistry):
+        if server_registry.shared_context is None:
+            server_registry.shared_context = Context(server_registry=server_registry)
+        context = server_registry.shared_context
+    else:
         context = Context(server_registry=server_registry)
 
     # Create the aggregator
-    aggregator = MCPAggregator(
+    aggregator = LazyMCPAggregator(
         server_names=servers,
         connection_persistence=connection_persistence,
         name=name,
@@ -121,13 +651,51 @@ def create_mcp_aggregator(
 
     return aggregator
 
+def get_mcp_aggregator_pool(
+    run_context: RunContextWrapper[TContext]
+) -> dict[tuple[int, frozenset[str]], MCPAggregator] | None:
+    """
+    Get the pool of MCP aggregators from the context object, if it has one.
+
+    A context object can define an `mcp_aggregators` dict to keep persistent MCP aggregators (and
+    so the MCP server connections) alive across runs, keyed by the id of their server registry and
+    their set of server names. The owner of the context is then responsible for closing the pooled
+    aggregators.
+    """
+    return getattr(run_context.context, 'mcp_aggregators', None)
+
 async def initialize_mcp_aggregator(
     run_context: RunContextWrapper[TContext],
     name: str,
     servers: list[str],
     server_registry: ServerRegistry | None = None,
-    connection_persistence: bool = True) -> MCPAggregator:
-    """Initialize the MCP aggregator, which initializes all the server connections."""
+    connection_persistence: bool = True,
+    lazy: bool = True,
+    use_pool: bool = True) -> MCPAggregator:
+    """
+    Initialize the MCP aggregator. If `lazy`, this doesn't connect to any servers: each server
+    connection is initialized on first use instead. Otherwise all the server connections are
+    initialized concurrently.
+
+    If `use_pool`, persistent aggregators are reused from the context's aggregator pool if it has
+    one (see `get_mcp_aggregator_pool`), and added to it when created. A persistent aggregator
+    must be closed in the same task that initialized it, so callers initializing it in a task
+    other than the one which will close the pool (e.g. streamed runs) must not use the pool.
+    """
+    pool = get_mcp_aggregator_pool(run_context) if use_pool and connection_persistence else None
+
+    # Agents may use different server registries for the same server names, so the registry is
+    # part of the pool key. A pooled aggregator references its registry, so the id can't be reused.
+    if not server_registry:
+        server_registry = getattr(run_context.context, 'mcp_server_registry', None)
+    pool_key = (id(server_registry), frozenset(servers))
+    if pool is not None and pool_key in pool and pool[pool_key].initialized:
+        logger.debug("Reusing pooled MCPAggregator for %s with servers %s.", name, servers)
+        aggregator = pool[pool_key]
+        if not lazy:
+            await aggregator.load_servers()
+        return aggregator
+
     # Create the aggregator
     aggregator = create_mcp_aggregator(
         run_context=run_context,
@@ -141,13 +709,52 @@ async def initialize_mcp_aggregator(
     try:
         logger.info("Initializing MCPAggregator for %s with servers %s.", name, servers)
         await aggregator.__aenter__()
+        if not lazy:
+            await aggregator.load_servers()
         logger.debug("MCPAggregator created and initialized for %s.", name)
-        return aggregator
     except Exception as e:
         logger.error("Error creating MCPAggregator: %s", e)
         await aggregator.__aexit__(None, None, None)
         raise
 
+    if pool is not None:
+        pool[pool_key] = aggregator
+
+    return aggregator
+
+def _text_content_to_text(content: TextContent) -> str:
+    return content.text
+
+def _image_content_to_text(content: ImageContent) -> str:
+    # Image content - convert to text description
+    return f"[Image: {content.mimeType}]"
+
+def _embedded_resource_to_text(content: EmbeddedResource) -> str:
+    resource = content.resource
+    if isinstance(resource, TextResourceContents):
+        return resource.text
+    return f"[Resource: {resource.mimeType or 'unknown type'}]"
+
+# Text conversion for each MCP content type, dispatched on the exact type of the content
+_CONTENT_TO_TEXT: dict[type, Callable[[Any], str]] = {
+    TextContent: _text_content_to_text,
+    ImageContent: _image_content_to_text,
+    EmbeddedResource: _embedded_resource_to_text,
+}
+
+def _content_item_to_text(item: Any) -> str:
+    to_text = _CONTENT_TO_TEXT.get(type(item))
+    if to_text is not None:
+        return to_text(item)
+
+    # Subclasses of the MCP content types
+    for content_type, to_text in _CONTENT_TO_TEXT.items():
+        if isinstance(item, content_type):
+            return to_text(item)
+
+    # Fallback to string representation
+    return str(item)
+
 def mcp_content_to_text(content: MCPContent | list[MCPContent]) -> str:
     """
     Convert CallToolResult MCP content to text.
@@ -158,50 +765,20 @@ def mcp_content_to_text(content: MCPContent | list[MCPContent]) -> str:
     Returns:
         String representation of the content
     """
-    # Handle list of content items
+    # Handle list of content items, skipping the ones without any text
     if isinstance(content, list):
-        text_parts = []
-        for item in content:
-            if hasattr(item, 'type') and item.type == 'text' and hasattr(item, 'text'):
-                # Text content
-                text_parts.append(item.text)
-            elif hasattr(item, 'type') and item.type == 'image' and hasattr(item, 'data'):
-                # Image content - convert to text description
-                mime_type = getattr(item, 'mimeType', 'unknown type')
-                text_parts.append(f"[Image: {mime_type}]")
-            elif hasattr(item, 'resource'):
-                # Embedded resource
-                resource = item.resource
-                if hasattr(resource, 'text'):
-                    text_parts.append(resource.text)
-                elif hasattr(resource, 'blob'):
-                    mime_type = getattr(resource, 'mimeType', 'unknown type')
-                    text_parts.append(f"[Resource: {mime_type}]")
-            else:
-                # Unknown content type
-                text_parts.append(str(item))
-
-        if text_parts:
-            return "\n".join(text_parts)
-        return ""
+        # Most tool results are a single content item, which doesn't need joining
+        if len(content) == 1:
+            return _content_item_to_text(content[0])
+        return "\n".join(
+            [text for item in content if (text := _content_item_to_text(item))]
+        )
 
     # Single content item
-    if hasattr(content, 'type') and content.type == 'text' and hasattr(content, 'text'):
-        return content.text
-    elif hasattr(content, 'type') and content.type == 'image' and hasattr(content, 'data'):
-        mime_type = getattr(content, 'mimeType', 'unknown type')
-        return f"[Image: {mime_type}]"
-    elif hasattr(content, 'resource'):
-        resource = content.resource
-        if hasattr(resource, 'text'):
-            return resource.text
-        elif hasattr(resource, 'blob'):
-            mime_type = getattr(resource, 'mimeType', 'unknown type')
-            return f"[Resource: {mime_type}]"
-
-    # Fallback to string representation
-    return str(content)
+    return _content_item_to_text(content)
 
+# Function tools converted from MCP tools, keyed by (aggregator id, name, description, schema).
+# A function tool references its aggregator, so the aggregator id can't be reused while cached.
 async def mcp_list_tools(server_aggregator: MCPAggregator) -> list[Tool]:
     """
     List all available tools from MCP servers that are part of the provided server aggregator.
@@ -219,23 +796,25 @@ async def mcp_list_tools(server_aggregator: MCPAggregator) -> list[Tool]:
     # Get tools list from the aggregator
     tools_result = await server_aggregator.list_tools()
 
-    # Convert MCP tools to OpenAI Agent SDK tools
+    # Convert MCP tools to OpenAI Agent SDK tools, reusing the ones the aggregator converted before
     mcp_tools: list[Tool] = []
     for mcp_tool in tools_result.tools:
-        tool = mcp_tool_to_function_tool(mcp_tool, server_aggregator)
-        mcp_tools.append(tool)
+        if isinstance(server_aggregator, LazyMCPAggregator):
+            mcp_tools.append(server_aggregator.get_function_tool(mcp_tool))
+        else:
+            mcp_tools.append(mcp_tool_to_function_tool(mcp_tool, server_aggregator))
 
     return mcp_tools
 
 
 # JSON Schema properties not supported by OpenAI functions
-UNSUPPORTED_SCHEMA_PROPERTIES = {
-    "minimum", "minLength", "maxLength", "pattern", "format", "minItems", "maxItems", 
-    "uniqueItems", "minProperties", "maxProperties", "multipleOf", 
+UNSUPPORTED_SCHEMA_PROPERTIES = frozenset({
+    "minimum", "minLength", "maxLength", "pattern", "format", "minItems", "maxItems",
+    "uniqueItems", "minProperties", "maxProperties", "multipleOf",
     "exclusiveMinimum", "exclusiveMaximum", "$schema", "examples", "default"
-}
+})
 
-def sanitize_json_schema_for_openai(schema: Dict[str, Any]) -> Dict[str, Any]:
+def sanitize_json_schema_for_openai(schema: dict[str, Any]) -> dict[str, Any]:
     """
     Sanitize a JSON Schema to make it compatible with OpenAI function calling.
     Removes properties not supported by OpenAI's function schema validation.
@@ -251,7 +830,8 @@ def sanitize_json_schema_for_openai(schema: Dict[str, Any]) -> Dict[str, Any]:
 
     result = {}
 
-    # Process each key in the schema
+    # Process each key in the schema. A plain loop rather than a dict comprehension: schemas are
+    # mostly small dicts, and before Python 3.12 every comprehension call creates a function frame.
     for key, value in schema.items():
         # Skip unsupported properties
         if key in UNSUPPORTED_SCHEMA_PROPERTIES:
@@ -268,13 +848,13 @@ def sanitize_json_schema_for_openai(schema: Dict[str, Any]) -> Dict[str, Any]:
             ]
         else:
             result[key] = value
-    
+
     # Special handling for the properties/required issue
     # OpenAI requires all properties to be in the required array
     if "type" in result and result["type"] == "object" and "properties" in result:
         # Get all property names
         property_names = list(result.get("properties", {}).keys())
-        
+
         # Set required field to include all properties
         if property_names:
             result["required"] = property_names
@@ -293,7 +873,7 @@ def mcp_tool_to_function_tool(
 
     # Create a wrapper factory to ensure each tool gets its own closure
     def create_wrapper(current_tool_name: str, current_tool_desc: str):
-        async def wrapper_fn(ctx: RunContextWrapper[TContext], **kwargs: Any) -> Any:
+        async def wrapper_fn(ctx: RunContextWrapper[TContext], **kwargs: Any) -> str:
             """MCP Tool wrapper function."""
             if not server_aggregator or server_aggregator.initialized is False:
                 raise RuntimeError(
@@ -301,27 +881,20 @@ def mcp_tool_to_function_tool(
                 )
 
             # Call the tool through the aggregator
-            result = await server_aggregator.call_tool(
+            result: CallToolResult = await server_aggregator.call_tool(
                 name=current_tool_name,
                 arguments=kwargs
             )
 
-            # Handle errors
-            if getattr(result, 'isError', False):
-                error_message = "Unknown error"
-                # Try to extract error from content if available
-                if hasattr(result, 'content'):
-                    error_message = mcp_content_to_text(result.content)
+            # Handle errors, extracting the error from the content if available
+            if result.isError:
+                error_message = mcp_content_to_text(result.content) or "Unknown error"
                 raise RuntimeError(
                     f"Error calling MCP tool '{current_tool_name}': {error_message}"
                 )
 
             # Convert MCP content to string using helper method
-            if hasattr(result, 'content'):
-                return mcp_content_to_text(result.content)
-
-            # Fallback for unexpected formats
-            return str(result)
+            return mcp_content_to_text(result.content)
 
         # Set proper name and docstring for the function
         wrapper_fn.__name__ = function_name
@@ -333,15 +906,15 @@ def mcp_tool_to_function_tool(
     wrapper_fn = create_wrapper(mcp_tool.name, tool_desc)
 
     # Create JSON schema for parameters - MCP uses inputSchema 
-    params_schema = getattr(mcp_tool, 'inputSchema', {
+    input_schema = getattr(mcp_tool, 'inputSchema', None) or {
         "type": "object",
         "properties": {},
         "required": [],
-    })
-
-    # OpenAI requires additionalProperties to be false for tool schemas
-    params_schema["additionalProperties"] = False
+    }
 
+    # OpenAI requires additionalProperties to be false for tool schemas.
+    # Copy rather than mutate the MCP tool's schema, which belongs to the aggregator's listing.
+    params_schema = {**input_schema, "additionalProperties": False}
 
     # Sanitize schema to remove properties not supported by OpenAI
     # OpenAI doesn't support minLength, maxLength, pattern, format, etc.
@@ -352,8 +925,7 @@ def mcp_tool_to_function_tool(
         async def invoke_tool(run_context: RunContextWrapper[Any], arguments_json: str) -> str:
             try:
                 # Parse arguments from JSON
-                import json
-                args = json.loads(arguments_json)
+                args = _json_loads(arguments_json)
 
                 # Call the wrapper function with the arguments
                 result = await current_wrapper_fn(run_context, **args)
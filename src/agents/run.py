@@ -503,8 +503,10 @@ class Runner:
                 from .mcp import ensure_mcp_server_registry_in_context
                 ensure_mcp_server_registry_in_context(context_wrapper)
 
-                # Load MCP tools for the starting agent
-                await current_agent.load_mcp_tools(context_wrapper)
+                # Load MCP tools for the starting agent. The streamed run executes in its own
+                # task, so its aggregator isn't pooled: pooled aggregators are closed by the
+                # context owner from another task, which anyio's task groups don't allow.
+                await current_agent.load_mcp_tools(context_wrapper, use_pool=False)
 
             while True:
                 if streamed_result.is_complete:
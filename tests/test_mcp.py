@@ -0,0 +1,675 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import os
+import weakref
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any
+
+import anyio
+import pytest
+from mcp.types import (
+    BlobResourceContents,
+    CallToolResult,
+    EmbeddedResource,
+    ImageContent,
+    JSONRPCMessage,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    ListToolsResult,
+    TextContent,
+    TextResourceContents,
+    Tool as MCPTool,
+)
+from mcp_agent.config import MCPServerSettings, MCPSettings, Settings
+from mcp_agent.mcp_server_registry import ServerRegistry
+
+from agents import Agent, RunContextWrapper
+from agents.mcp import (
+    LazyMCPAggregator,
+    clear_mcp_server_registry_cache,
+    create_mcp_aggregator,
+    ensure_mcp_server_registry_in_context,
+    initialize_mcp_aggregator,
+    load_mcp_server_registry,
+    mcp_content_to_text,
+    mcp_list_tools,
+    mcp_tool_to_function_tool,
+    sanitize_json_schema_for_openai,
+)
+
+CONFIG_YAML = """
+mcp:
+  servers:
+    fetch:
+      command: "uvx"
+      args: ["mcp-server-fetch"]
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_registry_cache():
+    clear_mcp_server_registry_cache()
+    yield
+    clear_mcp_server_registry_cache()
+
+
+def _make_config(command: str = "uvx") -> MCPSettings:
+    return MCPSettings(servers={"fetch": MCPServerSettings(command=command, args=["fetch"])})
+
+
+def test_registry_cached_for_equal_config_objects():
+    first = load_mcp_server_registry(config=_make_config())
+    second = load_mcp_server_registry(config=_make_config())
+    assert first is second
+
+    other = load_mcp_server_registry(config=_make_config(command="npx"))
+    assert other is not first
+
+
+def test_registry_cache_bypassed_when_disabled():
+    first = load_mcp_server_registry(config=_make_config())
+    second = load_mcp_server_registry(config=_make_config(), use_cache=False)
+    assert first is not second
+
+
+def test_registry_cached_by_config_path_and_mtime(tmp_path):
+    config_file = tmp_path / "mcp_agent.config.yaml"
+    config_file.write_text(CONFIG_YAML)
+
+    first = load_mcp_server_registry(config_path=str(config_file))
+    assert "fetch" in first.registry
+    assert load_mcp_server_registry(config_path=str(config_file)) is first
+
+    # Touching the file invalidates the cached entry
+    stat = os.stat(config_file)
+    os.utime(config_file, (stat.st_atime, stat.st_mtime + 10))
+
+    reloaded = load_mcp_server_registry(config_path=str(config_file))
+    assert reloaded is not first
+    assert load_mcp_server_registry(config_path=str(config_file)) is reloaded
+
+
+def test_registry_cache_invalidated_by_secrets_file(tmp_path):
+    config_file = tmp_path / "mcp_agent.config.yaml"
+    config_file.write_text(CONFIG_YAML)
+    secrets_file = tmp_path / "mcp_agent.secrets.yaml"
+    secrets_file.write_text("mcp:\n  servers:\n    fetch:\n      env:\n        API_KEY: old\n")
+
+    first = load_mcp_server_registry(config_path=str(config_file))
+    assert first.registry["fetch"].env == {"API_KEY": "old"}
+
+    secrets_file.write_text("mcp:\n  servers:\n    fetch:\n      env:\n        API_KEY: new\n")
+    stat = os.stat(secrets_file)
+    os.utime(secrets_file, (stat.st_atime, stat.st_mtime + 10))
+
+    reloaded = load_mcp_server_registry(config_path=str(config_file))
+    assert reloaded is not first
+    assert reloaded.registry["fetch"].env == {"API_KEY": "new"}
+
+
+def test_server_registry_attached_to_context():
+    class Context:
+        def __init__(self):
+            self.mcp_config = _make_config()
+
+    run_context = RunContextWrapper(context=Context())
+    registry = ensure_mcp_server_registry_in_context(run_context)
+    assert run_context.context.mcp_server_registry is registry
+    assert ensure_mcp_server_registry_in_context(run_context) is registry
+
+    reloaded = ensure_mcp_server_registry_in_context(run_context, force=True)
+    assert reloaded is not registry
+    assert run_context.context.mcp_server_registry is reloaded
+
+
+def test_aggregators_share_context_for_same_registry():
+    registry = load_mcp_server_registry(config=_make_config())
+    run_context = RunContextWrapper(context=None)
+    first = create_mcp_aggregator(run_context, "a", ["fetch"], server_registry=registry)
+    second = create_mcp_aggregator(run_context, "b", ["fetch"], server_registry=registry)
+    assert first.context is second.context
+    assert first.context.server_registry is registry
+
+    other_registry = load_mcp_server_registry(config=_make_config(command="npx"))
+    other = create_mcp_aggregator(run_context, "c", ["fetch"], server_registry=other_registry)
+    assert other.context is not first.context
+
+
+def test_shared_context_does_not_keep_uncached_registry_alive():
+    # A registry built by hand, which isn't held by the registry cache
+    registry = ServerRegistry(config=Settings(mcp=_make_config()))
+    registry_ref = weakref.ref(registry)
+    aggregator = create_mcp_aggregator(
+        RunContextWrapper(context=None), "a", ["fetch"], server_registry=registry
+    )
+    assert aggregator.context.server_registry is registry
+
+    del aggregator
+
+    del registry
+    gc.collect()
+    assert registry_ref() is None
+
+
+def test_config_file_merged_with_secrets(tmp_path):
+    config_file = tmp_path / "mcp_agent.config.yaml"
+    config_file.write_text(CONFIG_YAML)
+    (tmp_path / "mcp_agent.secrets.yaml").write_text(
+        "mcp:\n  servers:\n    fetch:\n      env:\n        API_KEY: secret\n"
+    )
+
+    registry = load_mcp_server_registry(config_path=str(config_file))
+    assert registry.registry["fetch"].command == "uvx"
+    assert registry.registry["fetch"].env == {"API_KEY": "secret"}
+
+
+def test_config_file_parsed_from_json_cache(tmp_path, monkeypatch):
+    config_file = tmp_path / "mcp_agent.config.yaml"
+    config_file.write_text(CONFIG_YAML)
+
+    load_mcp_server_registry(config_path=str(config_file), use_cache=False)
+    assert (tmp_path / ".mcp_agent.config.cache.json").exists()
+
+    # The fresh JSON cache is used instead of parsing the YAML again
+    def fail_load_yaml(path):
+        raise AssertionError("YAML should not be parsed when the JSON cache is fresh")
+
+    monkeypatch.setattr("agents.mcp._load_yaml_file", fail_load_yaml)
+    registry = load_mcp_server_registry(config_path=str(config_file), use_cache=False)
+    assert registry.registry["fetch"].args == ["mcp-server-fetch"]
+
+
+def test_json_cache_does_not_contain_secrets(tmp_path):
+    config_file = tmp_path / "mcp_agent.config.yaml"
+    config_file.write_text(CONFIG_YAML)
+    (tmp_path / "mcp_agent.secrets.yaml").write_text(
+        "openai:\n  api_key: sk-SECRET\n"
+        "mcp:\n  servers:\n    fetch:\n      env:\n        API_KEY: env-SECRET\n"
+    )
+
+    load_mcp_server_registry(config_path=str(config_file), use_cache=False)
+    cache_file = tmp_path / ".mcp_agent.config.cache.json"
+    assert cache_file.exists()
+    assert "SECRET" not in cache_file.read_text()
+
+    # Secrets are still merged in when the config is loaded from the JSON cache
+    registry = load_mcp_server_registry(config_path=str(config_file), use_cache=False)
+    assert registry.registry["fetch"].env == {"API_KEY": "env-SECRET"}
+
+
+def test_stale_json_cache_is_ignored(tmp_path):
+    config_file = tmp_path / "mcp_agent.config.yaml"
+    config_file.write_text(CONFIG_YAML)
+    load_mcp_server_registry(config_path=str(config_file), use_cache=False)
+
+    config_file.write_text(CONFIG_YAML.replace("uvx", "pipx"))
+    stat = os.stat(config_file)
+    os.utime(config_file, (stat.st_atime, stat.st_mtime + 10))
+
+    registry = load_mcp_server_registry(config_path=str(config_file), use_cache=False)
+    assert registry.registry["fetch"].command == "pipx"
+
+
+def test_json_cache_ignored_for_changed_config_with_same_mtime(tmp_path):
+    config_file = tmp_path / "mcp_agent.config.yaml"
+    config_file.write_text(CONFIG_YAML)
+    load_mcp_server_registry(config_path=str(config_file), use_cache=False)
+
+    # e.g. a config copied over with `cp -p`, which preserves the mtime
+    stat = os.stat(config_file)
+    config_file.write_text(CONFIG_YAML.replace("uvx", "pipx"))
+    os.utime(config_file, (stat.st_atime, stat.st_mtime))
+
+    registry = load_mcp_server_registry(config_path=str(config_file), use_cache=False)
+    assert registry.registry["fetch"].command == "pipx"
+
+
+class FakeClientSession:
+    def __init__(self, server_name: str, calls: list[str]):
+        self.server_name = server_name
+        self.calls = calls
+
+    async def list_tools(self) -> ListToolsResult:
+        self.calls.append(f"list_tools:{self.server_name}")
+        return ListToolsResult(
+            tools=[
+                MCPTool(
+                    name=f"{self.server_name}_tool",
+                    description=f"Tool of {self.server_name}",
+                    inputSchema={"type": "object", "properties": {}},
+                )
+            ]
+        )
+
+    async def call_tool(self, name: str, arguments: dict[str, Any] | None = None):
+        self.calls.append(f"call_tool:{self.server_name}.{name}")
+        if arguments and "fail" in arguments:
+            return CallToolResult(
+                isError=True, content=[TextContent(type="text", text=arguments["fail"])]
+            )
+        return CallToolResult(content=[TextContent(type="text", text=f"{name} result")])
+
+
+@pytest.fixture
+def fake_servers(monkeypatch, tmp_path):
+    """Fakes MCP server connections, recording the requests made to the servers."""
+    calls: list[str] = []
+
+    @asynccontextmanager
+    async def fake_gen_client(server_name, server_registry, **kwargs):
+        yield FakeClientSession(server_name, calls)
+
+    monkeypatch.setattr("agents.mcp.gen_client", fake_gen_client)
+    monkeypatch.setattr("mcp_agent.mcp.mcp_aggregator.gen_client", fake_gen_client)
+    monkeypatch.setattr("agents.mcp._SERVER_DESCRIPTIONS_DIR", tmp_path / "descriptions")
+    return calls
+
+
+async def _initialize_lazy_aggregator(lazy: bool = True) -> LazyMCPAggregator:
+    registry = load_mcp_server_registry(
+        config=MCPSettings(
+            servers={
+                "fetch": MCPServerSettings(command="uvx", args=["fetch"]),
+                "filesystem": MCPServerSettings(command="npx", args=["filesystem"]),
+            }
+        )
+    )
+    aggregator = await initialize_mcp_aggregator(
+        RunContextWrapper(context=None),
+        name="test",
+        servers=["fetch", "filesystem"],
+        server_registry=registry,
+        connection_persistence=False,
+        lazy=lazy,
+    )
+    assert isinstance(aggregator, LazyMCPAggregator)
+    return aggregator
+
+
+@pytest.mark.asyncio
+async def test_lazy_aggregator_does_not_connect_on_initialize(fake_servers):
+    aggregator = await _initialize_lazy_aggregator()
+    assert aggregator.initialized
+    assert fake_servers == []
+
+
+@pytest.mark.asyncio
+async def test_lazy_aggregator_lists_tools_from_server_descriptions_cache(fake_servers):
+    aggregator = await _initialize_lazy_aggregator()
+    tools = await aggregator.list_tools()
+    assert [tool.name for tool in tools.tools] == ["fetch-fetch_tool", "filesystem-filesystem_tool"]
+    assert fake_servers == ["list_tools:fetch", "list_tools:filesystem"]
+
+    # A new aggregator lists tools from the cached server descriptions, without connecting
+    fake_servers.clear()
+    aggregator = await _initialize_lazy_aggregator()
+    tools = await aggregator.list_tools()
+    assert [tool.name for tool in tools.tools] == ["fetch-fetch_tool", "filesystem-filesystem_tool"]
+    assert fake_servers == []
+
+    # Only the server of the called tool is connected to
+    result = await aggregator.call_tool("fetch-fetch_tool", arguments={})
+    assert result.content[0].text == "fetch_tool result"
+    assert fake_servers == ["list_tools:fetch", "call_tool:fetch.fetch_tool"]
+
+
+@pytest.mark.asyncio
+async def test_lazy_aggregator_resolves_unnamespaced_tool_names(fake_servers):
+    aggregator = await _initialize_lazy_aggregator()
+    await aggregator.list_tools()
+
+    result = await aggregator.call_tool("filesystem_tool")
+    assert not result.isError
+    assert fake_servers[-1] == "call_tool:filesystem.filesystem_tool"
+
+    result = await aggregator.call_tool("missing_tool")
+    assert result.isError
+
+
+@pytest.mark.asyncio
+async def test_eager_aggregator_connects_to_servers_concurrently(fake_servers, monkeypatch):
+    active = 0
+    max_active = 0
+    fetch_server_tools = LazyMCPAggregator._fetch_server_tools
+
+    async def tracking_fetch_server_tools(self, server_name):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return await fetch_server_tools(self, server_name)
+
+    monkeypatch.setattr(LazyMCPAggregator, "_fetch_server_tools", tracking_fetch_server_tools)
+
+    aggregator = await _initialize_lazy_aggregator(lazy=False)
+    assert sorted(fake_servers) == ["list_tools:fetch", "list_tools:filesystem"]
+    assert max_active == 2
+
+    # Tools are already loaded, so listing them doesn't connect again
+    fake_servers.clear()
+    tools = await aggregator.list_tools()
+    assert len(tools.tools) == 2
+    assert fake_servers == []
+
+
+def test_sanitize_json_schema_removes_unsupported_properties():
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {
+            "url": {"type": "string", "format": "uri", "minLength": 1},
+            "tags": {"type": "array", "items": {"type": "string", "pattern": "^a"}, "maxItems": 3},
+            "limit": {"type": "integer", "default": 5},
+        },
+    }
+    assert sanitize_json_schema_for_openai(schema) == {
+        "type": "object",
+        "properties": {
+            "url": {"type": "string"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "limit": {"type": "integer"},
+        },
+        "required": ["url", "tags", "limit"],
+    }
+    # The original schema is left untouched
+    assert schema["properties"]["url"]["format"] == "uri"
+
+
+def test_sanitize_json_schema_keeps_compatible_schema():
+    schema = {
+        "type": "object",
+        "properties": {"path": {"type": "string"}, "mode": {"type": "string", "enum": ["r"]}},
+        "required": ["path", "mode"],
+        "additionalProperties": False,
+    }
+    sanitized = sanitize_json_schema_for_openai(schema)
+    assert sanitized == schema
+    # A copy is returned, so the tool's input schema is never shared with the sanitized schema
+    assert sanitized is not schema
+    assert sanitized["properties"]["path"] is not schema["properties"]["path"]
+
+    # Nested objects get their required properties patched as well
+    nested = {
+        "type": "object",
+        "properties": {"options": {"type": "object", "properties": {"a": {"type": "string"}}}},
+        "required": ["options"],
+    }
+    assert sanitize_json_schema_for_openai(nested)["properties"]["options"]["required"] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_function_tool_invokes_mcp_tool(fake_servers):
+    aggregator = await _initialize_lazy_aggregator()
+    tools = await mcp_list_tools(aggregator)
+    assert [tool.name for tool in tools] == ["fetch-fetch_tool", "filesystem-filesystem_tool"]
+
+    result = await tools[0].on_invoke_tool(RunContextWrapper(context=None), "{}")
+    assert result == "fetch_tool result"
+    assert fake_servers[-1] == "call_tool:fetch.fetch_tool"
+
+    # Invalid arguments are reported back to the model rather than raised
+    result = await tools[0].on_invoke_tool(RunContextWrapper(context=None), "not json")
+    assert result.startswith("Error (JSONDecodeError)")
+
+    # Tool errors are reported back to the model as well
+    result = await tools[0].on_invoke_tool(
+        RunContextWrapper(context=None), '{"fail": "bad input"}'
+    )
+    assert result == "Error (RuntimeError): Error calling MCP tool 'fetch-fetch_tool': bad input"
+
+
+@pytest.mark.asyncio
+async def test_mcp_list_tools_reuses_function_tools(fake_servers):
+    aggregator = await _initialize_lazy_aggregator()
+    tools = await mcp_list_tools(aggregator)
+    assert all(a is b for a, b in zip(tools, await mcp_list_tools(aggregator)))
+
+    # The aggregator keeps the function tools alive after a run drops its references to them
+    tool_refs = [weakref.ref(tool) for tool in tools]
+    del tools
+    gc.collect()
+    tools = await mcp_list_tools(aggregator)
+    assert [ref() for ref in tool_refs] == tools
+
+    # Invalidated tools are converted again
+    aggregator.invalidate_tools("fetch")
+    refreshed = await mcp_list_tools(aggregator)
+    assert refreshed[0] is not tools[0]
+    assert refreshed[1] is tools[1]
+
+    # Function tools are bound to their aggregator, so they aren't shared between aggregators
+    other_tools = await mcp_list_tools(await _initialize_lazy_aggregator())
+    assert not any(a is b for a, b in zip(tools, other_tools))
+
+
+def test_mcp_content_to_text():
+    content = [
+        TextContent(type="text", text="hello"),
+        ImageContent(type="image", data="aGk=", mimeType="image/png"),
+        EmbeddedResource(
+            type="resource",
+            resource=TextResourceContents(uri="file:///a.txt", text="file contents"),
+        ),
+        EmbeddedResource(
+            type="resource",
+            resource=BlobResourceContents(uri="file:///a.bin", blob="aGk=", mimeType="app/bin"),
+        ),
+    ]
+    assert mcp_content_to_text(content) == (
+        "hello\n[Image: image/png]\nfile contents\n[Resource: app/bin]"
+    )
+    assert mcp_content_to_text(content[1]) == "[Image: image/png]"
+    assert mcp_content_to_text([content[2]]) == "file contents"
+    assert mcp_content_to_text([]) == ""
+    assert mcp_content_to_text([content[0], TextContent(type="text", text=""), content[0]]) == (
+        "hello\nhello"
+    )
+
+
+@pytest.mark.asyncio
+async def test_persistent_aggregators_pooled_in_context(fake_servers):
+    class Context:
+        def __init__(self):
+            self.mcp_aggregators = {}
+
+    registry = load_mcp_server_registry(config=_make_config())
+    run_context = RunContextWrapper(context=Context())
+    aggregator = await initialize_mcp_aggregator(
+        run_context, name="a", servers=["fetch"], server_registry=registry
+    )
+    try:
+        assert run_context.context.mcp_aggregators == {
+            (id(registry), frozenset(["fetch"])): aggregator
+        }
+        pooled = await initialize_mcp_aggregator(
+            run_context, name="b", servers=["fetch"], server_registry=registry
+        )
+        assert pooled is aggregator
+
+        # Aggregators for the same servers from a different registry aren't shared
+        other_registry = load_mcp_server_registry(config=_make_config(command="npx"))
+        other = await initialize_mcp_aggregator(
+            run_context, name="c", servers=["fetch"], server_registry=other_registry
+        )
+        assert other is not aggregator
+        assert other.context.server_registry is other_registry
+    finally:
+        # Exit in reverse order, as the connection managers' task groups are nested
+        for pooled_aggregator in reversed(run_context.context.mcp_aggregators.values()):
+            await pooled_aggregator.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_aggregator_not_pooled_when_pool_disabled(fake_servers):
+    class Context:
+        def __init__(self):
+            self.mcp_aggregators = {}
+
+    registry = load_mcp_server_registry(config=_make_config())
+    run_context = RunContextWrapper(context=Context())
+    aggregator = await initialize_mcp_aggregator(
+        run_context, name="a", servers=["fetch"], server_registry=registry, use_pool=False
+    )
+    try:
+        assert run_context.context.mcp_aggregators == {}
+    finally:
+        await aggregator.__aexit__(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_pooled_agent_runs_do_not_sanitize_schemas_again(fake_servers, monkeypatch):
+    class Context:
+        def __init__(self):
+            self.mcp_aggregators = {}
+
+    aggregator = await _initialize_lazy_aggregator()
+
+    async def initialize_aggregator(*args, **kwargs):
+        return aggregator
+
+    sanitized: list[dict[str, Any]] = []
+
+    def sanitize(schema):
+        sanitized.append(schema)
+        return sanitize_json_schema_for_openai(schema)
+
+    monkeypatch.setattr("agents.mcp.initialize_mcp_aggregator", initialize_aggregator)
+    monkeypatch.setattr("agents.mcp.sanitize_json_schema_for_openai", sanitize)
+
+    agent = Agent(name="test", mcp_servers=["fetch", "filesystem"])
+    run_context = RunContextWrapper(context=Context())
+    await agent.load_mcp_tools(run_context)
+    await agent.cleanup_resources()
+    sanitized_count = len(sanitized)
+    assert sanitized_count > 0
+
+    # Later runs reuse the function tools (and their sanitized schemas) of the pooled aggregator
+    for _ in range(2):
+        gc.collect()
+        await agent.load_mcp_tools(run_context)
+        await agent.cleanup_resources()
+    assert len(sanitized) == sanitized_count
+
+
+@pytest.mark.asyncio
+async def test_agent_mcp_tools_not_duplicated_across_runs(fake_servers, monkeypatch):
+    async def initialize_aggregator(*args, **kwargs):
+        return await _initialize_lazy_aggregator()
+
+    monkeypatch.setattr("agents.mcp.initialize_mcp_aggregator", initialize_aggregator)
+
+    agent = Agent(name="test", mcp_servers=["fetch", "filesystem"])
+    run_context = RunContextWrapper(context=None)
+    for _ in range(2):
+        await agent.load_mcp_tools(run_context)
+        assert [tool.name for tool in agent.tools] == [
+            "fetch-fetch_tool",
+            "filesystem-filesystem_tool",
+        ]
+        await agent.cleanup_resources()
+        assert agent.tools == []
+
+
+def test_mcp_tool_to_function_tool_does_not_mutate_input_schema():
+    input_schema = {"type": "object", "properties": {"url": {"type": "string", "format": "uri"}}}
+    mcp_tool = MCPTool(name="fetch", description="Fetch a URL", inputSchema=input_schema)
+
+    tool = mcp_tool_to_function_tool(mcp_tool, server_aggregator=None)
+    assert tool.params_json_schema == {
+        "type": "object",
+        "properties": {"url": {"type": "string"}},
+        "additionalProperties": False,
+        "required": ["url"],
+    }
+    assert mcp_tool.inputSchema == {
+        "type": "object",
+        "properties": {"url": {"type": "string", "format": "uri"}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_lazy_aggregator_caches_tool_listing_until_invalidated(fake_servers):
+    aggregator = await _initialize_lazy_aggregator()
+    tools = await aggregator.list_tools()
+    assert await aggregator.list_tools() is tools
+    assert fake_servers == ["list_tools:fetch", "list_tools:filesystem"]
+
+    # Invalidating a server lists its tools from the server again, rather than its description
+    aggregator.invalidate_tools("fetch")
+    fake_servers.clear()
+    refreshed = await aggregator.list_tools()
+    assert refreshed is not tools
+    assert [tool.name for tool in refreshed.tools] == [tool.name for tool in tools.tools]
+    assert fake_servers == ["list_tools:fetch"]
+
+
+@pytest.mark.asyncio
+async def test_tool_list_changed_notification_refetches_tools(fake_servers, monkeypatch):
+    registry = load_mcp_server_registry(config=_make_config())
+    aggregator = await initialize_mcp_aggregator(
+        RunContextWrapper(context=None), name="test", servers=["fetch"], server_registry=registry
+    )
+
+    # In-memory transport between the aggregator's client session and a fake server
+    client_send, server_receive = anyio.create_memory_object_stream[JSONRPCMessage](10)
+    server_send, client_receive = anyio.create_memory_object_stream[JSONRPCMessage](10)
+    list_tools_calls: list[str] = []
+
+    async def serve():
+        async for message in server_receive:
+            request = message.root
+            if isinstance(request, JSONRPCRequest) and request.method == "tools/list":
+                list_tools_calls.append(request.method)
+                tools = [{"name": "fetch_tool", "inputSchema": {"type": "object"}}]
+                await server_send.send(
+                    JSONRPCMessage(
+                        JSONRPCResponse(jsonrpc="2.0", id=request.id, result={"tools": tools})
+                    )
+                )
+
+    sessions: list[Any] = []
+    stopped = anyio.Event()
+
+    async with anyio.create_task_group() as task_group:
+
+        async def run_session(session, *, task_status):
+            async with session:
+                task_status.started()
+                await stopped.wait()
+
+        # Like the connection manager, the session runs in a task of its own
+        async def get_server(server_name, client_session_factory, init_hook=None):
+            if not sessions:
+                sessions.append(client_session_factory(client_receive, client_send))
+                await task_group.start(run_session, sessions[0])
+            return SimpleNamespace(session=sessions[0])
+
+        monkeypatch.setattr(aggregator._persistent_connection_manager, "get_server", get_server)
+        task_group.start_soon(serve)
+
+        with anyio.fail_after(5):
+            await aggregator.list_tools()
+            assert list_tools_calls == ["tools/list"]
+            # Served from the in-memory listing until the server reports a change
+            await aggregator.list_tools()
+            assert list_tools_calls == ["tools/list"]
+
+            await server_send.send(
+                JSONRPCMessage(
+                    JSONRPCNotification(jsonrpc="2.0", method="notifications/tools/list_changed")
+                )
+            )
+            while list_tools_calls == ["tools/list"]:
+                await aggregator.list_tools()
+                await anyio.sleep(0.01)
+            assert list_tools_calls == ["tools/list", "tools/list"]
+
+        stopped.set()
+        task_group.cancel_scope.cancel()
+
+    await aggregator.__aexit__(None, None, None)